@@ -1,40 +1,41 @@
-from abc import ABC, abstractmethod
+from abc import ABC
 from typing import List, Optional
 import copy
 import re
-from io import StringIO
+
+_ADDR_RE = re.compile(r"[0-9]{1,3}\.{0,1}")
+
+def _copy_subclass_state(obj, new, memo, base):
+    """Deep-copy the slots and __dict__ a subclass adds on top of a slotted base."""
+    for klass in type(obj).__mro__:
+        if klass is base:
+            break
+        slots = klass.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name in ("__dict__", "__weakref__"):
+                continue
+            if name.startswith("__") and not name.endswith("__"):
+                name = f"_{klass.__name__.lstrip('_')}{name}"
+            if hasattr(obj, name):
+                setattr(new, name, copy.deepcopy(getattr(obj, name), memo))
+    state = getattr(obj, "__dict__", None)
+    if state:
+        new.__dict__.update(copy.deepcopy(state, memo))
 
 class Printable(ABC):
     """Base abstract class for printable objects."""
+    __slots__ = ()
     
     def print_me(self, os, prefix="", is_last=False, no_slash=False, is_root=False):
         """Base printing method for the tree structure display.
         Implement properly to display hierarchical structure."""
-        buffer = StringIO()
-
-        has_prefix = len(prefix) > 0
-
-        if has_prefix:
-            buffer.write(" " if no_slash else "|")
-
-        if is_root and not has_prefix or has_prefix:
-            buffer.write(prefix)
-            buffer.write("\\-" if is_last else "+-")
-
-        buffer.write(os)
-        buffer.write("\n")
-        
-        val = buffer.getvalue()
-        buffer.flush()
-        buffer.close()
+        bar = "" if not prefix else (" " if no_slash else "|")
+        conn = (prefix + ("\\-" if is_last else "+-")) if (prefix or is_root) else ""
+        return f"{bar}{conn}{os}\n"
 
-        return val
-
-        
-    @abstractmethod
     def clone(self):
         """Create a deep copy of this object."""
-        pass
+        return copy.deepcopy(self)
 
 class BasicCollection(Printable):
     """Base class for collections of items."""
@@ -45,118 +46,141 @@ class BasicCollection(Printable):
         self._items.append(elem)
     
     def find(self, elem):
-        index = self._items.index(elem)
-        return self._items[index]
-    
-    def clone(self):
-        return copy.deepcopy(self)
+        for item in self._items:
+            if item == elem:
+                return item
+        return None
 
 class Component(Printable):
     """Base class for computer components."""
-
-    def clone(self):
-        return copy.deepcopy(self)
+    __slots__ = ()
 
 class Address(Printable):
     """Class representing a network address."""
+    __slots__ = ("_Address__address",)
+
     def __init__(self, addr):
         self.validate(addr)
         self.__address = addr
     
-    def validate(self, addr):
-        pattern = r"[0-9]{1,3}\.{0,1}"
-
-        if not re.match(pattern, addr):
+    @staticmethod
+    def validate(addr):
+        if not _ADDR_RE.match(addr):
             raise ValueError("Malformed network address")
         
     def print_me(self, no_slash):
+        # Kept for API compatibility; Computer renders its address strings directly
         return super().print_me(os=self.__address, prefix=" ", no_slash=no_slash)
 
-    def clone(self):
-        return copy.deepcopy(self)
+    def __deepcopy__(self, memo):
+        new = self.__class__.__new__(self.__class__)
+        new.__address = self.__address
+        memo[id(self)] = new
+        if self.__class__ is not Address:
+            _copy_subclass_state(self, new, memo, Address)
+        return new
 
 class Computer(BasicCollection, Component):
     """Class representing a computer with addresses and components."""
+    # Bumped on every rename so networks know their name index is stale
+    _renames = 0
+
     def __init__(self, name):
         BasicCollection.__init__(self)
         Component.__init__(self)
-        self.name = name
+        self.__name = name
         self.__addresses = []
     
     def add_address(self, addr):
-        self.__addresses.append(Address(addr))
+        # Addresses are kept as validated strings; Address stays for API compatibility
+        Address.validate(addr)
+        self.__addresses.append(addr)
         return self
     
     def add_component(self, comp):
         self.add(comp)
         return self
 
+    @property
+    def name(self):
+        return self.__name
+
+    @name.setter
+    def name(self, value):
+        self.__name = value
+        Computer._renames += 1
+
     @property
     def components(self):
         return self._items
 
     def print_me(self, is_last, no_slash):
-        buffer = StringIO()
+        parts = []
 
-        buffer.write(super(Component, self).print_me(os=f"Host: {self.name}", is_last=is_last, is_root=True))
-        
-        for addr in self.__addresses:
-            buffer.write(addr.print_me(no_slash=no_slash))
+        parts.append(Printable.print_me(self, os=f"Host: {self.name}", is_last=is_last, is_root=True))
 
-        components_count = len(self._items)
-        for idx in range(components_count):
-            if idx == components_count - 1:
-                buffer.write(self._items[idx].print_me(is_last=True, no_slash=is_last))
-            else:
-                buffer.write(self._items[idx].print_me(is_last=False, no_slash=is_last))
+        emit = Printable.print_me
+        for addr in self.__addresses:
+            parts.append(emit(self, addr, " ", False, no_slash))
 
-        val = buffer.getvalue()
-        buffer.flush()
-        buffer.close()
+        items = self._items
+        if items:
+            for comp in items[:-1]:
+                parts.append(comp.print_me(is_last=False, no_slash=is_last))
+            parts.append(items[-1].print_me(is_last=True, no_slash=is_last))
 
-        return val
+        return "".join(parts)
 
-    def clone(self):
-        return copy.deepcopy(self)
+    def __deepcopy__(self, memo):
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__ = self.__dict__.copy()
+        memo[id(self)] = new
+        new._items = [copy.deepcopy(item, memo) for item in self._items]
+        new.__addresses = list(self.__addresses)
+        return new
 
 class Network(Printable):
     """Class representing a network of computers."""
     def __init__(self, name):
         self.__name = name
         self.__computers: list[Computer] = []
+        self.__by_name: dict[str, Computer] = {}
+        self.__indexed_at = Computer._renames
     
     def add_computer(self, comp: Computer):
         self.__computers.append(comp)
+        # Keep the first computer with a given name, as the linear search did
+        self.__by_name.setdefault(comp.name, comp)
         return self
     
     def find_computer(self, name):
-        found = list(filter(lambda c: c.name == name, self.__computers))
-        return found[0] if len(found) > 0 else None
+        if self.__indexed_at != Computer._renames:
+            self.__reindex()
+        return self.__by_name.get(name)
+
+    def __reindex(self):
+        self.__by_name = {}
+        for comp in self.__computers:
+            self.__by_name.setdefault(comp.name, comp)
+        self.__indexed_at = Computer._renames
     
     def __str__(self):
-        buffer = StringIO()
-
-        buffer.write(super().print_me(os=f"Network: {self.__name}", is_root=False))
+        parts = []
 
-        computers_count = len(self.__computers)
-        for idx in range(computers_count):
-            if idx == computers_count - 1:
-                buffer.write(self.__computers[idx].print_me(is_last=True, no_slash=True))
-            else:
-                buffer.write(self.__computers[idx].print_me(is_last=False, no_slash=False))
+        parts.append(super().print_me(os=f"Network: {self.__name}", is_root=False))
 
-        val = buffer.getvalue()
+        computers = self.__computers
+        if computers:
+            for comp in computers[:-1]:
+                parts.append(comp.print_me(is_last=False, no_slash=False))
+            parts.append(computers[-1].print_me(is_last=True, no_slash=True))
 
-        buffer.flush()
-        buffer.close()
-
-        return val.rstrip()
-
-    def clone(self):
-        return copy.deepcopy(self)
+        return "".join(parts).rstrip()
 
 class Disk(Component):
     """Disk component class with partitions."""
+    __slots__ = ("partitions", "_Disk__storage_type", "_Disk__size", "_Disk__type_str", "_Disk__used")
+
     # Определение типов дисков
     SSD = 0
     MAGNETIC = 1
@@ -169,43 +193,51 @@ class Disk(Component):
         
         self.__storage_type = storage_type
         self.__size = size
+        self.__used = 0
+        self.__type_str = "HDD" if storage_type == self.MAGNETIC else "SSD"
     
     def __str__(self):
-        return "HDD" if self.__storage_type == 1 else "SSD"
+        return self.__type_str
 
     def add_partition(self, size: int, name: str):
-        reminder = self.__size - sum(t[0] for t in self.partitions)
-
-        if size > reminder:
+        if size > self.__size - self.__used:
             raise ValueError("Cannot add partition! Not enogh space remained on the disk!")
 
         self.partitions.append((size, name))
+        self.__used += size
         return self
     
     def print_me(self, is_last, no_slash):
-        buffer = StringIO()
+        parts = []
 
-        buffer.write(super().print_me(os=f"{str(self)}, {self.__size} GiB", prefix=" ", is_last=is_last, no_slash=no_slash))
+        parts.append(Printable.print_me(self, os=f"{str(self)}, {self.__size} GiB", prefix=" ", is_last=is_last, no_slash=no_slash))
 
-        partitions_count = len(self.partitions)
-        for idx in range(partitions_count):
-            p_size, p_type = self.partitions[idx]
-            if idx == partitions_count - 1:
-                buffer.write(super().print_me(os=f"[{idx}]: {p_size} GiB, {p_type}", prefix=f"   ", is_last=True, no_slash=no_slash))
-            else:
-                buffer.write(super().print_me(os=f"[{idx}]: {p_size} GiB, {p_type}", prefix=f"   ", is_last=False, no_slash=no_slash))
-
-        val = buffer.getvalue()
-        buffer.flush()
-        buffer.close()
-
-        return val
+        last = len(self.partitions) - 1
+        emit = Printable.print_me
+        parts.extend(
+            emit(self, f"[{idx}]: {p_size} GiB, {p_type}", "   ", idx == last, no_slash)
+            for idx, (p_size, p_type) in enumerate(self.partitions)
+        )
 
-    def clone(self):
-        return copy.deepcopy(self)
+        return "".join(parts)
+
+    def __deepcopy__(self, memo):
+        new = self.__class__.__new__(self.__class__)
+        # Partitions are immutable tuples, so a shallow list copy is enough
+        new.partitions = list(self.partitions)
+        new.__storage_type = self.__storage_type
+        new.__size = self.__size
+        new.__used = self.__used
+        new.__type_str = self.__type_str
+        memo[id(self)] = new
+        if self.__class__ is not Disk:
+            _copy_subclass_state(self, new, memo, Disk)
+        return new
 
 class CPU(Component):
     """CPU component class."""
+    __slots__ = ("_CPU__cores", "_CPU__mhz")
+
     def __init__(self, cores: int, mhz: int):
         self.__cores = cores
         self.__mhz = mhz
@@ -213,19 +245,32 @@ class CPU(Component):
     def print_me(self, is_last, no_slash):
         return super().print_me(os=f"CPU, {self.__cores} cores @ {self.__mhz}MHz", prefix=" ", is_last=is_last, no_slash=no_slash)
 
-    def clone(self):
-        return copy.deepcopy(self)
+    def __deepcopy__(self, memo):
+        new = self.__class__.__new__(self.__class__)
+        new.__cores = self.__cores
+        new.__mhz = self.__mhz
+        memo[id(self)] = new
+        if self.__class__ is not CPU:
+            _copy_subclass_state(self, new, memo, CPU)
+        return new
 
 class Memory(Component):
     """Memory component class."""
+    __slots__ = ("_Memory__size",)
+
     def __init__(self, size: int):
         self.__size = size
         
     def print_me(self, is_last, no_slash):
         return super().print_me(os=f"Memory, {self.__size} MiB", prefix=" ", is_last=is_last, no_slash=no_slash)
 
-    def clone(self):
-        return copy.deepcopy(self)
+    def __deepcopy__(self, memo):
+        new = self.__class__.__new__(self.__class__)
+        new.__size = self.__size
+        memo[id(self)] = new
+        if self.__class__ is not Memory:
+            _copy_subclass_state(self, new, memo, Memory)
+        return new
 
 # Пример использования (может быть неполным или содержать ошибки)
 def main():